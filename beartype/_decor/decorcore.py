@@ -21,7 +21,16 @@ from beartype.roar import (
     BeartypeException,
     BeartypeDecorWrappeeException,
 )
-from beartype._cave._cavefast import MethodDecoratorBuiltinTypes
+from beartype.typing import (
+    Callable,
+    Dict,
+)
+from beartype._cave._cavefast import (
+    FunctionType,
+    MethodDecoratorClassType,
+    MethodDecoratorPropertyType,
+    MethodDecoratorStaticType,
+)
 from beartype._cave._cavemap import NoneTypeOr
 from beartype._conf.confcls import BeartypeConf
 from beartype._data.cls.datacls import TYPES_BEARTYPEABLE
@@ -35,13 +44,18 @@ from beartype._decor._decormore import (
     beartype_func_contextlib_contextmanager,
     beartype_pseudofunc,
 )
-from beartype._util.cls.utilclstest import is_type_subclass
+from beartype._util.cls.utilclstest import (
+    is_type_immutable,
+    is_type_subclass,
+)
+from beartype._util.error.utilerrwarn import is_warning_ignored
 from beartype._util.func.mod.utilfuncmodtest import (
     is_func_contextlib_contextmanager,
 )
 from beartype._util.func.utilfunctest import (
     is_func_python,
 )
+from beartype._util.module.lib.utilnumba import is_func_numba_dispatcher
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_10
 # from beartype._util.text.utiltextansi import strip_text_ansi
 from beartype._util.text.utiltextlabel import label_object_context
@@ -50,6 +64,7 @@ from beartype._util.text.utiltextmunge import (
     uppercase_str_char_first,
 )
 from beartype._util.text.utiltextprefix import prefix_beartypeable
+from re import compile as re_compile
 from traceback import format_exc
 from warnings import warn
 
@@ -59,8 +74,8 @@ def beartype_object(
     obj: BeartypeableT,
     conf: BeartypeConf,
 
-    # Variadic keyword parameters.
-    **kwargs
+    # Optional parameters.
+    cls_stack: TypeStack = None,
 ) -> BeartypeableT:
     '''
     Decorate the passed **beartypeable** (i.e., caller-defined object that may
@@ -75,9 +90,11 @@ def beartype_object(
         **Beartype configuration** (i.e., dataclass encapsulating all flags,
         options, settings, and other metadata configuring the current decoration
         of the decorated callable or class).
-
-    All remaining keyword parameters are passed as is to whichever lower-level
-    decorator this higher-level decorator calls on the passed beartypeable.
+    cls_stack : TypeStack, optional
+        **Type stack** (i.e., either a tuple of the one or more
+        :func:`beartype.beartype`-decorated classes lexically containing the
+        class variable or method annotated by this hint *or* :data:`None`).
+        Defaults to :data:`None`.
 
     Returns
     ----------
@@ -97,16 +114,24 @@ def beartype_object(
     # print(f'Decorating object {repr(obj)}...')
 
     # Return either...
+    #
+    # Note that this decorator is called once for each decorated object (and
+    # thus potentially thousands of times at import time under import hooks).
+    # For efficiency, this decorator intentionally accesses the private slotted
+    # "BeartypeConf._warning_cls_on_decorator_exception" instance variable
+    # directly rather than the public
+    # "BeartypeConf.warning_cls_on_decorator_exception" property wrapping that
+    # variable, avoiding the cost of a Python-level property call.
     return (
-        _beartype_object_fatal(obj, conf, **kwargs)
+        _beartype_object_fatal(obj, conf, cls_stack)
         # If this beartype configuration requests that this decorator raise
         # fatal exceptions at decoration time, defer to the lower-level
         # decorator doing so;
-        if conf.warning_cls_on_decorator_exception is None else
+        if conf._warning_cls_on_decorator_exception is None else
         # Else, this beartype configuration requests that this decorator emit
         # fatal warnings at decoration time. In this case, defer to the
         # lower-level decorator doing so.
-        _beartype_object_nonfatal(obj, conf, **kwargs)
+        _beartype_object_nonfatal(obj, conf, cls_stack)
     )
 
 # ....................{ PRIVATE ~ decorators               }....................
@@ -153,6 +178,25 @@ def _beartype_object_fatal(
         Memoized parent decorator wrapping this unmemoized child decorator.
     '''
 
+    # Type of this object.
+    obj_type = type(obj)
+
+    # Lower-level decorator specific to this type if this type is a common
+    # beartypeable type *OR* "None" otherwise (i.e., if this type is either
+    # uncommon or *NOT* beartypeable).
+    #
+    # Note that the overwhelming majority of beartypeables are pure-Python
+    # functions and builtin method descriptors, whose decoration is thus
+    # dispatched in constant time by a single dictionary lookup. All other
+    # beartypeables are decorated by the slower chain of predicates below.
+    beartype_obj_type = _TYPE_TO_BEARTYPE_OBJ_TYPE.get(obj_type)
+
+    # If this type is a common beartypeable type, return this object decorated
+    # by the lower-level decorator specific to this type.
+    if beartype_obj_type is not None:
+        return beartype_obj_type(obj, conf=conf, cls_stack=cls_stack)  # type: ignore[return-value]
+    # Else, this type is either uncommon or *NOT* beartypeable.
+    #
     # If this object is a class, return this class decorated with type-checking.
     #
     # Note that the passed "cls_curr" class is ignorable in this context.
@@ -180,46 +224,6 @@ def _beartype_object_fatal(
         )
     # Else, this object is a non-class.
     # print(f'Decorating non-type {repr(obj)}...')
-
-    # Type of this object.
-    obj_type = type(obj)
-
-    # If this object is an uncallable builtin method descriptor (i.e., either a
-    # property, class method, instance method, or static method object),
-    # @beartype was listed above rather than below the builtin decorator
-    # generating this descriptor in the chain of decorators decorating this
-    # decorated callable. Although @beartype typically *MUST* decorate a
-    # callable directly, this edge case is sufficiently common *AND* trivial to
-    # resolve to warrant doing so. To do so, this conditional branch effectively
-    # reorders @beartype to be the first decorator decorating the pure-Python
-    # function underlying this method descriptor: e.g.,
-    #
-    #     # This branch detects and reorders this edge case...
-    #     class MuhClass(object):
-    #         @beartype
-    #         @classmethod
-    #         def muh_classmethod(cls) -> None: pass
-    #
-    #     # ...to resemble this direct decoration instead.
-    #     class MuhClass(object):
-    #         @classmethod
-    #         @beartype
-    #         def muh_classmethod(cls) -> None: pass
-    #
-    # Note that most but *NOT* all of these objects are uncallable. Regardless,
-    # *ALL* of these objects are unsuitable for direct decoration. Specifically:
-    # * Under Python < 3.10, *ALL* of these objects are uncallable.
-    # * Under Python >= 3.10:
-    #   * Descriptors created by @classmethod and @property are uncallable.
-    #   * Descriptors created by @staticmethod are technically callable but
-    #     C-based and thus unsuitable for decoration.
-    if obj_type in MethodDecoratorBuiltinTypes:
-        return beartype_descriptor_decorator_builtin(  # type: ignore[return-value]
-            descriptor=obj,
-            conf=conf,
-            cls_stack=cls_stack,
-        )
-    # Else, this object is *NOT* an uncallable builtin method descriptor.
     #
     # If this object is uncallable, raise an exception.
     elif not callable(obj):
@@ -227,7 +231,19 @@ def _beartype_object_fatal(
             f'Uncallable {repr(obj)} not decoratable by @beartype.')
     # Else, this object is callable.
     #
-    # If this object is *NOT* a pure-Python function, this object is a
+    # If this object is a Numba dispatcher (i.e., pseudo-callable created by a
+    # just-in-time compilation decorator published by the third-party "numba"
+    # package), preserve this dispatcher as is. Numba dispatchers define
+    # non-standard __call__() dunder methods that *CANNOT* be safely
+    # monkey-patched with type-checking below. Attempting to do so would raise
+    # an exception -- which under import hooks published by the "beartype.claw"
+    # subpackage would then be coerced into one warning for *EACH* Numba
+    # dispatcher in the codebase being imported.
+    elif is_func_numba_dispatcher(obj):
+        return obj
+    # Else, this object is *NOT* a Numba dispatcher.
+    #
+    # If this object is *NOT* a pure-Python callable, this object is a
     # pseudo-callable (i.e., arbitrary pure-Python *OR* C-based object whose
     # class defines the __call__() dunder method enabling this object to be
     # called like a standard callable). In this case, attempt to monkey-patch
@@ -241,8 +257,47 @@ def _beartype_object_fatal(
             conf=conf,
             cls_stack=cls_stack,
         )
-    # Else, this object is a pure-Python function.
-    #
+    # Else, this object is a pure-Python callable that is *NOT* a pure-Python
+    # function (e.g., a bound method).
+
+    # Return a new callable decorating that callable with type-checking.
+    return _beartype_func_python(obj, conf=conf, cls_stack=cls_stack)
+
+
+def _beartype_func_python(
+    # Mandatory parameters.
+    func: BeartypeableT,
+    conf: BeartypeConf,
+
+    # Optional parameters.
+    cls_stack: TypeStack = None,
+) -> BeartypeableT:
+    '''
+    Decorate the passed **pure-Python callable** (i.e., callable whose
+    implementation resides in a pure-Python code object) with optimal
+    type-checking dynamically generated unique to that callable.
+
+    Parameters
+    ----------
+    func : BeartypeableT
+        Pure-Python callable to be decorated.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., dataclass encapsulating all flags,
+        options, settings, and other metadata configuring the current decoration
+        of the decorated callable or class).
+    cls_stack : TypeStack, optional
+        **Type stack** (i.e., either a tuple of the one or more
+        :func:`beartype.beartype`-decorated classes lexically containing the
+        class variable or method annotated by this hint *or* :data:`None`).
+        Defaults to :data:`None`.
+
+    Returns
+    ----------
+    BeartypeableT
+        New callable wrapping this callable with dynamically generated
+        type-checking.
+    '''
+
     # If this function is a @contextlib.contextmanager-based isomorphic
     # decorator closure (i.e., closure both created and returned by the standard
     # @contextlib.contextmanager decorator where that closure isomorphically
@@ -283,9 +338,9 @@ def _beartype_object_fatal(
     #     @contextmanager
     #     @beartype
     #     def muh_contextmanager(cls) -> Iterator[None]: yield
-    elif is_func_contextlib_contextmanager(obj):
+    if is_func_contextlib_contextmanager(func):
         return beartype_func_contextlib_contextmanager(  # type: ignore[return-value]
-            func=obj,
+            func=func,
             conf=conf,
             cls_stack=cls_stack,
         )
@@ -294,20 +349,19 @@ def _beartype_object_fatal(
 
     # Return a new callable decorating that callable with type-checking.
     return beartype_func(  # type: ignore[return-value]
-        func=obj,
+        func=func,
         conf=conf,
         cls_stack=cls_stack,
     )
 
 
-#FIXME: Unit test us up, please.
 def _beartype_object_nonfatal(
     # Mandatory parameters.
     obj: BeartypeableT,
     conf: BeartypeConf,
 
-    # Variadic keyword parameters.
-    **kwargs
+    # Optional parameters.
+    cls_stack: TypeStack = None,
 ) -> BeartypeableT:
     '''
     Decorate the passed **beartypeable** (i.e., pure-Python callable or class)
@@ -345,10 +399,11 @@ def _beartype_object_nonfatal(
         **Beartype configuration** (i.e., dataclass encapsulating all flags,
         options, settings, and other metadata configuring the current decoration
         of the decorated callable or class).
-
-    All remaining keyword parameters are passed as is to the lower-level
-    :func:`._beartype_object_fatal` decorator internally called by this
-    higher-level decorator on the passed beartypeable.
+    cls_stack : TypeStack, optional
+        **Type stack** (i.e., either a tuple of the one or more
+        :func:`beartype.beartype`-decorated classes lexically containing the
+        class variable or method annotated by this hint *or* :data:`None`).
+        Defaults to :data:`None`.
 
     Returns
     ----------
@@ -374,15 +429,31 @@ def _beartype_object_nonfatal(
 
     # Attempt to decorate the passed beartypeable.
     try:
-        return _beartype_object_fatal(obj, conf, **kwargs)
+        return _beartype_object_fatal(obj, conf, cls_stack)
     # If doing so unexpectedly raises an exception, coerce that fatal exception
     # into a non-fatal warning for nebulous safety.
     except Exception as exception:
         # Category of warning to be emitted.
-        warning_category = conf.warning_cls_on_decorator_exception
+        warning_category = conf._warning_cls_on_decorator_exception
         assert is_type_subclass(warning_category, Warning), (
             f'{repr(warning_category)} not warning category.')
 
+        # If warnings of this category are unconditionally ignored, silently
+        # return this object unmodified *WITHOUT* constructing a warning
+        # message that would simply be ignored. Under import hooks published by
+        # the "beartype.claw" subpackage, this decorator may be called on
+        # thousands of beartypeables in codebases that are only partially
+        # type-checkable by @beartype. Constructing warning messages for those
+        # beartypeables (notably, formatting tracebacks with format_exc()) then
+        # dominates the cost of importing those codebases.
+        #
+        # Note that the assertion above guarantees this category to be
+        # non-"None" here. Since mypy fails to infer this, this call is
+        # explicitly ignored below.
+        if is_warning_ignored(warning_category):  # type: ignore[arg-type]
+            return obj  # type: ignore[return-value]
+        # Else, warnings of this category are possibly emitted.
+
         # Original error message to be embedded in the warning message to be
         # emitted, stripped of *ALL* ANSI color. While colors improve the
         # readability of exception messages that percolate down to an ANSI-aware
@@ -407,11 +478,17 @@ def _beartype_object_nonfatal(
             format_exc()
         )
 
-        # Indent this exception message by globally replacing *EVERY* newline in
-        # this message with a newline followed by four spaces. Doing so visually
-        # offsets this lower-level exception message from the higher-level
-        # warning message embedding this exception message below.
-        error_message = error_message.replace('\n', '\n    ')
+        # If this exception message spans multiple lines, indent this message by
+        # globally replacing *EVERY* newline in this message with a newline
+        # followed by four spaces. Doing so visually offsets this lower-level
+        # exception message from the higher-level warning message embedding
+        # this exception message below.
+        #
+        # Note that beartype-specific exception messages are typically
+        # single-line, in which case this replacement is safely avoidable.
+        if '\n' in error_message:
+            error_message = error_message.replace('\n', '\n    ')
+        # Else, this exception message is single-line.
 
         # Warning message to be emitted, consisting of:
         # * A human-readable label contextually describing this beartypeable,
@@ -464,36 +541,57 @@ def _beartype_type(
         f'{repr(cls_stack)} neither tuple nor "None".')
     # assert isinstance(conf, BeartypeConf), f'{repr(conf)} not configuration.'
 
-    #FIXME: Insufficient. We also want to set a beartype-specific dunder
-    #attribute -- say, "__beartyped" -- on this class. Additionally, if this
-    #class has already been @beartyped, we want to detect that here and avoid
-    #re-@beartype-ing this class. In short, we want to generalize our existing
-    #"beartype._util.func.mod.utilbeartypefunc" submodule to support classes as
-    #well. Let's shift that submodule somewhere more general, please. Perhaps:
-    #* Rename "beartype._util.func.mod.utilbeartypefunc" to
-    #  "beartype._util.check.utilcheckfunc".
-    #* Define a new "beartype._util.check.utilchecktype" submodule containing
-    #  similar class-specific functionality.
-    #FIXME: Actually... *NO.* We absolutely do *NOT* want to monkey-patch random
-    #@beartype-specific attributes into user-defined classes, because then the
-    #Python ecosystem will shudder, then sway, then crack, and finally tumble
-    #into the churning seas below. Instead, let's find something *ELSE* that is
-    #actually safe to monkey-patch. Method objects are the classic example.
-    #Nobody cares if we monkey-patch those. The most common method object would
-    #be the "cls.__init__" object. Of course, many types do *NOT* define that
-    #object -- but many types also do. We could simply:
-    #* Decide whether the "cls.__init__" method exists.
-    #* Decide whether the "cls.__init__.__beartyped_cls" attribute exists. Note
-    #  that this attribute is distinct from our existing "__beartyped"
-    #  attribute, when records a lower-level and less useful truth.
+    # If this class has already been decorated by @beartype, silently reduce to
+    # a noop by returning this class as is. Ideally, this decorator would
+    # detect this by monkey-patching a @beartype-specific dunder attribute
+    # (e.g., "__beartyped") into this class. Pragmatically, doing so would
+    # pollute user-defined classes whose metaclasses or "__slots__" may prohibit
+    # (or worse, silently misbehave under) such monkey-patching. Instead, this
+    # decorator monkey-patches the far safer "__init__" method of this class
+    # below when this class directly defines that method. Nobody cares if we
+    # monkey-patch method objects.
     #
-    #For example:
-    #    is_type_beartyped = getattr(
-    #        getattr(cls, '__init__', None), '__beartyped_cls', False)
+    # Note that this test intentionally compares the class recorded on this
+    # method against this class by identity. Why? Because subclasses of this
+    # class inheriting this method would otherwise erroneously be detected as
+    # already decorated despite *NOT* directly being decorated.
+    if getattr(
+        getattr(cls, '__init__', None), _BEARTYPED_CLS_ATTR_NAME, None) is cls:
+        return cls
+    # Else, this class has yet to be decorated by @beartype.
     #
-    #Pretty sure that suffices. It's just a simple two-liner. This is only an
-    #optimization, so it doesn't particularly matter if it fails to apply to
-    #some classes. So, let's a-go!
+    # If this class is immutable (e.g., a builtin type), silently reduce to a
+    # noop by returning this class as is. Since setting *ANY* attribute on this
+    # class raises a "TypeError", decorating the attributes of this class
+    # would be pointless.
+    elif is_type_immutable(cls):
+        return cls
+    # Else, this class is mutable.
+    #
+    # If this class is an attribute of a parent class currently being decorated
+    # *AND* the fully-qualified name of this class is *NOT* prefixed by that of
+    # that parent class, this class is *NOT* lexically nested in that parent
+    # class but merely aliased by that parent class (e.g.,
+    # "ndarray = numpy.ndarray"). In this case, silently reduce to a noop by
+    # returning this class as is. Decorating this class would monkey-patch a
+    # foreign class (e.g., from a third-party package) that the user never
+    # requested be type-checked -- which, under import hooks published by the
+    # "beartype.claw" subpackage, could emit thousands of non-fatal warnings
+    # for foreign classes that @beartype is unable to decorate.
+    #
+    # Note that this test intentionally inspects qualified names rather than
+    # the names of the modules declaring these classes. Users may freely
+    # rewrite the "__module__" dunder attribute of the parent class (e.g., to
+    # publish that class from a public module) *WITHOUT* rewriting that of
+    # classes lexically nested in that class. In either case, the qualified
+    # names of lexically nested classes are unconditionally prefixed by the
+    # qualified names of their parent classes.
+    elif cls_stack is not None and not getattr(
+        cls, '__qualname__', '').startswith(
+        f'{getattr(cls_stack[-1], "__qualname__", "")}.'):
+        return cls
+    # Else, this class is either the root class being decorated *OR* a class
+    # lexically nested in the parent class currently being decorated.
 
     #FIXME: Unit test us up, please. Test against at least:
     #* A dataclass. We already do this, of course. Hurrah!
@@ -508,6 +606,34 @@ def _beartype_type(
     #* A PEP 563-fueled self-referential class. See this as a simple example:
     #     https://github.com/beartype/beartype/issues/152#issuecomment-1197778501
 
+    # List of 2-tuples "(attr_name, attr_value)" of the unqualified name and
+    # value of each beartypeable direct (i.e., *NOT* indirectly inherited)
+    # attribute of this class.
+    #
+    # Note that:
+    # * This list intentionally filters these attributes with a list
+    #   comprehension rather than an explicit iteration. The former performs
+    #   this filtering in a tighter bytecode loop than the latter, which matters
+    #   for classes defining many non-beartypeable attributes (e.g., class
+    #   variables, nested non-callable data).
+    # * This list intentionally precedes rather than interleaves the
+    #   setattr() calls performed below. Doing so avoids iterating over the
+    #   dictionary of this class while simultaneously modifying that
+    #   dictionary.
+    attrs_beartypeable = [
+        (attr_name, attr_value)
+        for attr_name, attr_value in cls.__dict__.items()  # pyright: ignore[reportGeneralTypeIssues]
+        if isinstance(attr_value, TYPES_BEARTYPEABLE)
+    ]
+
+    # If this class directly defines *NO* beartypeable attributes (e.g., a
+    # class defining only class variables), silently reduce to a noop by
+    # returning this class as is. Doing so avoids needlessly creating a new
+    # class stack below for such classes.
+    if not attrs_beartypeable:
+        return cls  # type: ignore[return-value]
+    # Else, this class directly defines one or more beartypeable attributes.
+
     # Replace the passed class stack with a new class stack appending this
     # decorated class to the top of this stack, reflecting the fact that this
     # decorated class is now the most deeply lexically nested class for the
@@ -528,78 +654,166 @@ def _beartype_type(
         cls_stack + (cls,)
     )
 
-    # For the unqualified name and value of each direct (i.e., *NOT* indirectly
-    # inherited) attribute of this class...
-    for attr_name, attr_value in cls.__dict__.items():  # pyright: ignore[reportGeneralTypeIssues]
-        # If this attribute is beartypeable...
-        if isinstance(attr_value, TYPES_BEARTYPEABLE):
-            # This attribute decorated with type-checking configured by this
-            # configuration if *NOT* already decorated.
-            attr_value_beartyped = beartype_object(
-                obj=attr_value,
-                conf=conf,
-                cls_stack=cls_stack,
-            )
-
-            # Attempt to...
-            try:
-                # Replace this undecorated attribute with this decorated
-                # attribute.
-                #
-                # Note that class attributes are *ONLY* settable by calling the
-                # tragically slow setattr() builtin. Attempting to directly set
-                # an attribute on the class dictionary raises an exception. Why?
-                # Because class dictionaries are actually low-level
-                # "mappingproxy" objects that intentionally override the
-                # __setattr__() dunder method to unconditionally raise an
-                # exception. Why? Because that constraint enables the
-                # type.__setattr__() dunder method to enforce critical
-                # efficiency constraints on class attributes -- including that
-                # class attribute keys are *NOT* only strings but also valid
-                # Python identifiers:
-                #     >>> class OhGodHelpUs(object): pass
-                #     >>> OhGodHelpUs.__dict__['even_god_cannot_help'] = 2
-                #     TypeError: 'mappingproxy' object does not support item
-                #     assignment
-                #
-                # See also this relevant StackOverflow answer by Python luminary
-                # Raymond Hettinger:
-                #     https://stackoverflow.com/a/32720603/2809027
-                setattr(cls, attr_name, attr_value_beartyped)
-            # If doing so raises a builtin "TypeError"...
-            except TypeError as exception:
-                #FIXME: Shift this detection logic into a new
-                #is_typeerror_attr_immutable() tester, please.
-
-                # Message raised with this "TypeError".
-                exception_message = str(exception)
-
-                # If this message satisfies a pattern , then this "TypeError" signifies this attribute
-                # to be inherited from an immutable builtin type (e.g., "str")
-                # subclassed by this user-defined subclass. In this case,
-                # silently skip past this uncheckable attribute to the next.
-                #
-                # Note that this pattern depends on the current Python version.
-                if (
-                    # The active Python interpreter targets Python >= 3.10,
-                    # match a message of the form "cannot set '{attr_name}'
-                    # attribute of immutable type '{cls_name}'".
-                    IS_PYTHON_AT_LEAST_3_10 and (
-                        exception_message.startswith("cannot set '") and
-                        "' attribute of immutable type " in exception_message
-                    # Else, the active Python interpreter targets Python <= 3.9.
-                    # In this case, match a message of the form "can't set
-                    # attributes of built-in/extension type '{cls_name}'".
-                    ) or exception_message.startswith(
-                        "can't set attributes of built-in/extension type '")
-                ):
-                    continue
-                # Else, this message does *NOT* satisfy that pattern.
-
-                # Preserve this exception by re-raising this exception.
-                raise
-        # Else, this attribute is *NOT* beartypeable. In this case, silently
-        # ignore this attribute.
+    # For the unqualified name and value of each beartypeable direct attribute
+    # of this class...
+    for attr_name, attr_value in attrs_beartypeable:
+        # This attribute decorated with type-checking configured by this
+        # configuration if *NOT* already decorated.
+        #
+        # Note that this attribute is intentionally passed positionally.
+        # This decorator is called once for each beartypeable attribute of
+        # each decorated class, where keyword arguments are slightly slower
+        # to bind than positional arguments.
+        attr_value_beartyped = beartype_object(attr_value, conf, cls_stack)
+
+        # Attempt to...
+        try:
+            # Replace this undecorated attribute with this decorated
+            # attribute.
+            #
+            # Note that class attributes are *ONLY* settable by calling the
+            # tragically slow setattr() builtin. Attempting to directly set
+            # an attribute on the class dictionary raises an exception. Why?
+            # Because class dictionaries are actually low-level
+            # "mappingproxy" objects that intentionally override the
+            # __setattr__() dunder method to unconditionally raise an
+            # exception. Why? Because that constraint enables the
+            # type.__setattr__() dunder method to enforce critical
+            # efficiency constraints on class attributes -- including that
+            # class attribute keys are *NOT* only strings but also valid
+            # Python identifiers:
+            #     >>> class OhGodHelpUs(object): pass
+            #     >>> OhGodHelpUs.__dict__['even_god_cannot_help'] = 2
+            #     TypeError: 'mappingproxy' object does not support item
+            #     assignment
+            #
+            # See also this relevant StackOverflow answer by Python luminary
+            # Raymond Hettinger:
+            #     https://stackoverflow.com/a/32720603/2809027
+            setattr(cls, attr_name, attr_value_beartyped)
+        # If doing so raises a builtin "TypeError"...
+        except TypeError as exception:
+            # If the message raised with this "TypeError" satisfies a
+            # pattern, then this "TypeError" signifies this attribute to be
+            # inherited from an immutable builtin type (e.g., "str")
+            # subclassed by this user-defined subclass. In this case,
+            # silently skip past this uncheckable attribute to the next.
+            #
+            # Note that immutable classes are already detected and ignored
+            # above. This test thus only serves as a fallback for immutable
+            # classes *NOT* detected by the is_type_immutable() tester.
+            if _TYPEERROR_ATTR_IMMUTABLE_REGEX.match(str(exception)):
+                continue
+            # Else, this message does *NOT* satisfy that pattern.
+
+            # Preserve this exception by re-raising this exception.
+            raise
+
+    # "__init__" method directly defined by this class if any *OR* "None".
+    cls_init = cls.__dict__.get('__init__')  # pyright: ignore[reportGeneralTypeIssues]
+
+    # If this class directly defines this method, record this class to have
+    # been decorated by @beartype on this method. See above for discussion.
+    if cls_init is not None:
+        # Attempt to do so.
+        try:
+            setattr(cls_init, _BEARTYPED_CLS_ATTR_NAME, cls)
+        # If doing so fails, this method is C-based and thus prohibits
+        # attribute assignment. Since this is only an optimization, silently
+        # ignore this failure.
+        except (AttributeError, TypeError):
+            pass
+    # Else, this class does *NOT* directly define this method. In this case,
+    # this class will be redecorated by subsequent decorations. Although
+    # inefficient, redecorating is harmless; @beartype already reduces to a
+    # noop on callables previously wrapped by @beartype.
 
     # Return this class as is.
     return cls  # type: ignore[return-value]
+
+# ....................{ PRIVATE ~ constants                }....................
+_BEARTYPED_CLS_ATTR_NAME = '__beartyped_cls'
+'''
+Name of the @beartype-specific dunder attribute monkey-patched by the
+:func:`._beartype_type` decorator into the ``__init__`` method directly defined
+by each class decorated by that decorator, whose value is that class.
+
+This attribute enables that decorator to efficiently detect and avoid
+redecorating classes previously decorated by that decorator.
+'''
+
+_TYPEERROR_ATTR_IMMUTABLE_REGEX = re_compile(
+    # If the active Python interpreter targets Python >= 3.10, match a message
+    # of the form "cannot set '{attr_name}' attribute of immutable type
+    # '{cls_name}'".
+    r"cannot set '.*' attribute of immutable type "
+    if IS_PYTHON_AT_LEAST_3_10 else
+    # Else, the active Python interpreter targets Python <= 3.9. In this case,
+    # match a message of the form "can't set attributes of
+    # built-in/extension type '{cls_name}'".
+    r"can't set attributes of built-in/extension type '"
+)
+'''
+Compiled regular expression matching the message of the builtin
+:exc:`TypeError` exception raised by the :func:`setattr` builtin when
+attempting to set an attribute inherited from an immutable builtin type (e.g.,
+:class:`str`) on a user-defined subclass of that type.
+
+Note that the form of this message depends on the active Python interpreter.
+This expression is thus selected once at module importation time rather than
+repeatedly at decoration time.
+'''
+
+
+_TYPE_TO_BEARTYPE_OBJ_TYPE: Dict[type, Callable] = {
+    # Pure-Python functions (including unbound methods) are the common case.
+    FunctionType: _beartype_func_python,
+
+    # If this object is an uncallable builtin method descriptor (i.e., either a
+    # property, class method, or static method object), @beartype was listed
+    # above rather than below the builtin decorator generating this descriptor
+    # in the chain of decorators decorating this decorated callable. Although
+    # @beartype typically *MUST* decorate a callable directly, this edge case is
+    # sufficiently common *AND* trivial to resolve to warrant doing so. To do
+    # so, this decorator effectively reorders @beartype to be the first
+    # decorator decorating the pure-Python function underlying this method
+    # descriptor: e.g.,
+    #
+    #     # This decorator detects and reorders this edge case...
+    #     class MuhClass(object):
+    #         @beartype
+    #         @classmethod
+    #         def muh_classmethod(cls) -> None: pass
+    #
+    #     # ...to resemble this direct decoration instead.
+    #     class MuhClass(object):
+    #         @classmethod
+    #         @beartype
+    #         def muh_classmethod(cls) -> None: pass
+    #
+    # Note that most but *NOT* all of these objects are uncallable. Regardless,
+    # *ALL* of these objects are unsuitable for direct decoration. Specifically:
+    # * Under Python < 3.10, *ALL* of these objects are uncallable.
+    # * Under Python >= 3.10:
+    #   * Descriptors created by @classmethod and @property are uncallable.
+    #   * Descriptors created by @staticmethod are technically callable but
+    #     C-based and thus unsuitable for decoration.
+    MethodDecoratorClassType: beartype_descriptor_decorator_builtin,
+    MethodDecoratorPropertyType: beartype_descriptor_decorator_builtin,
+    MethodDecoratorStaticType: beartype_descriptor_decorator_builtin,
+}
+'''
+Dictionary mapping from each **common beartypeable type** (i.e., type of the
+overwhelming majority of beartypeables passed to the
+:func:`._beartype_object_fatal` decorator) to the lower-level decorator
+specific to that type, accepting that beartypeable as its first positional
+parameter and all remaining parameters as keyword parameters.
+
+This dictionary enables that decorator to dispatch the decoration of common
+beartypeables in constant time rather than testing those beartypeables against
+a chain of increasingly expensive predicates.
+
+Note that this dictionary intentionally omits the type of bound methods.
+Although most bound methods wrap pure-Python functions, bound methods may also
+wrap C-based callables, which are instead decorated as pseudo-callables.
+'''
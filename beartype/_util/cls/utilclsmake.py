@@ -13,7 +13,9 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.roar._roarexc import _BeartypeUtilTypeException
 from beartype.typing import (
+    Hashable,
     Optional,
+    Set,
     Tuple,
     Type,
 )
@@ -21,6 +23,7 @@ from beartype._cave._cavemap import NoneTypeOr
 from beartype._data.hint.datahinttyping import LexicalScope
 from beartype._data.kind.datakinddict import DICT_EMPTY
 from beartype._util.text.utiltextident import is_identifier
+from weakref import WeakValueDictionary
 
 # ....................{ MAKERS                             }....................
 def make_type(
@@ -32,6 +35,9 @@ def make_type(
     type_bases: Optional[Tuple[type, ...]] = None,
     type_scope: Optional[LexicalScope] = None,
     type_doc: Optional[str] = None,
+    type_slots: Optional[Tuple[str, ...]] = None,
+    is_type_cached: bool = False,
+    type_scope_key: Optional[Hashable] = None,
     exception_cls: Type[Exception] = _BeartypeUtilTypeException,
 ) -> type:
     '''
@@ -49,6 +55,12 @@ def make_type(
         Tuple of all base classes to be inherited by this class. Defaults to
         the empty tuple, equivalent to the 1-tuple ``(object,)`` inheriting this
         class from only the root base class :class:`object` of all classes.
+        If one or more of these base classes have a metaclass other than
+        :class:`type`, this class is created by the most derived such
+        metaclass. This includes the
+        :class:`beartype._util.cache.utilcachemeta.BeartypeCachingMeta`
+        metaclass, which memoizes instances of this class (but not the class
+        itself) while preserving :func:`isinstance` and subclassing.
     type_scope : Optional[Dict[str, Any]]
         Dictionary mapping from the name to value of each **class-scoped
         attribute** (i.e., method, variable) to be defined by this class.
@@ -57,6 +69,37 @@ def make_type(
     type_doc : Optional[str]
         Human-readable docstring documenting this class. Defaults to
         :data:`None`, in which case this class remains undocumented.
+    type_slots : Optional[Tuple[str, ...]], optional
+        Tuple of the names of all **slotted instance variables** (i.e.,
+        instance variables declared by the ``__slots__`` dunder class variable)
+        to be defined by this class. Defaults to :data:`None`, in which case
+        this class is unslotted and each instance of this class is thus
+        accompanied by an instance dictionary. Passing the empty tuple slots
+        this class with *no* instance variables, which prevents instances of
+        this class from being accompanied by instance dictionaries and thus
+        reduces the space consumed by these instances. Note that instances of
+        this class are accompanied by instance dictionaries regardless of this
+        parameter if one or more base classes of this class are unslotted.
+    is_type_cached : bool, optional
+        :data:`True` only if memoizing this class (i.e., returning the same
+        class previously created and returned by a prior call to this factory
+        passed the same name, module name, base classes, class scope key,
+        docstring, and slots). Defaults to :data:`False`, in which case a new
+        class is unconditionally created and returned. Callers should enable
+        this parameter *only* for classes that are never subsequently modified
+        (e.g., by setting class attributes), as modifying a memoized class
+        modifies that class for *all* callers sharing that class. If the passed
+        class scope is non-empty *and* the ``type_scope_key`` parameter is
+        unpassed, this parameter is silently ignored.
+    type_scope_key : Optional[Hashable], optional
+        Arbitrary hashable object uniquely identifying the passed class scope
+        when memoizing this class. Defaults to :data:`None`, in which case only
+        classes with empty class scopes are memoized. Class scopes are *not*
+        identifiable by their key-value pairs, as distinct values comparing
+        equal (e.g., ``1``, ``1.0``, and ``True``) would then erroneously
+        identify the same class. Callers memoizing classes with non-empty
+        scopes should thus pass a key uniquely identifying each such scope.
+        This parameter is ignored when *not* memoizing this class.
     exception_cls : Type[Exception], optional
         Type of exception to raise in the event of a fatal error. Defaults to
         :exc:`._BeartypeUtilTypeException`.
@@ -75,11 +118,54 @@ def make_type(
         * The passed classname is empty.
         * The passed classname is non-empty but *NOT* a valid unqualified Python
           identifier.
+        * The passed module name is *NOT* a valid Python identifier.
     '''
     assert isinstance(type_name, str), f'{repr(type_name)} not string.'
     assert isinstance(type_doc, NoneTypeOr[str]), (
         f'{repr(type_doc)} neither "None" nor string.')
 
+    # If memoizing this class whose scope is non-empty *AND* the caller passed
+    # *NO* key identifying this scope, silently avoid memoizing this class.
+    # Why? Because a key derived from the values of this scope would compare
+    # those values by equality rather than identity. Since distinct values
+    # may compare equal (e.g., "1 == 1.0 == True"), doing so would erroneously
+    # return a previously memoized class defining the wrong class attributes.
+    if is_type_cached and type_scope and type_scope_key is None:
+        is_type_cached = False
+    # Else, either this class is *NOT* memoized, this scope is empty, *OR* the
+    # caller passed a key identifying this scope.
+
+    # If memoizing this class...
+    if is_type_cached:
+        # Attempt to...
+        try:
+            # Hashable key uniquely identifying this class, consisting of all
+            # parameters passed above except the class scope and exception
+            # type. The class scope is identified by the passed key if any
+            # *OR* "None" if this scope is empty. Since the exception type is
+            # only relevant to invalid parameters *AND* invalid parameters are
+            # never cached, that type is safely ignorable.
+            type_key = (
+                type_name,
+                type_module_name,
+                type_bases,
+                type_scope_key,
+                type_doc,
+                type_slots,
+            )
+
+            # Return the class previously cached under this key if any.
+            return _MAKE_TYPE_CACHE[type_key]  # type: ignore[return-value]
+        # If this key is unhashable (i.e., the passed scope key is unhashable),
+        # silently create an uncached class below.
+        except TypeError:
+            is_type_cached = False
+        # If *NO* class has been cached under this key, create this class below
+        # and then cache this class under this key.
+        except KeyError:
+            pass
+    # Else, this class is *NOT* memoized.
+
     # If this classname is *NOT* a valid unqualified Python identifier, raise an
     # exception. Insanely, the builtin type.__init__() constructor silently
     # allows this classname to be invalid -- despite the resulting class
@@ -87,9 +173,39 @@ def make_type(
     # * The empty string.
     # * An invalid Python identifier.
     # * A valid fully-qualified Python identifier.
-    if not type_name.isidentifier():
+    #
+    # Note that classnames are typically drawn from a small vocabulary
+    # repeatedly passed to this factory. This classname is thus first tested
+    # against the set of all classnames previously validated by this factory,
+    # avoiding a linear scan of the characters of this classname on most calls.
+    if type_name in _TYPE_NAMES_VALID:
+        pass
+    elif not type_name.isidentifier():
         raise exception_cls(f'Class name {repr(type_name)} invalid.')
-    # Else, this classname is a valid unqualified Python identifier.
+    # Else, this classname is a valid unqualified Python identifier. In this
+    # case, record this classname as valid.
+    else:
+        _cache_identifier_valid(_TYPE_NAMES_VALID, type_name)
+
+    # If this class has a module name *AND* this module name is *NOT* a valid
+    # Python identifier, raise an exception. As above, this module name is first
+    # tested against the set of all module names previously validated by this
+    # factory. Since the is_identifier() tester is implemented in pure Python
+    # and thus substantially slower than the C-based str.isidentifier() method,
+    # this set is even more beneficial here.
+    #
+    # Note that this module name is intentionally validated *BEFORE* creating
+    # this class below, avoiding the needless creation of a class that would
+    # then be discarded on raising this exception.
+    if type_module_name is None or type_module_name in _TYPE_MODULE_NAMES_VALID:
+        pass
+    elif not is_identifier(type_module_name):
+        raise exception_cls(
+            f'Class module name {repr(type_module_name)} invalid.')
+    # Else, this module name is a valid Python identifier. In this case, record
+    # this module name as valid.
+    else:
+        _cache_identifier_valid(_TYPE_MODULE_NAMES_VALID, type_module_name)
 
     # Default all unpassed parameters.
     if type_bases is None:
@@ -99,19 +215,24 @@ def make_type(
     assert isinstance(type_bases, tuple), f'{repr(type_bases)} not tuple.'
     assert isinstance(type_scope, dict), f'{repr(type_scope)} not dictionary.'
 
+    # If slotting this class...
+    if type_slots is not None:
+        assert isinstance(type_slots, tuple), f'{repr(type_slots)} not tuple.'
+        assert '__slots__' not in type_scope, (
+            f'Class scope {repr(type_scope)} already defines "__slots__".')
+
+        # Shallow copy of this class scope additionally declaring these slots.
+        # Note that this scope is intentionally copied rather than modified,
+        # preserving both the caller's scope *AND* the shared empty dictionary
+        # singleton possibly defaulted to above.
+        type_scope = {**type_scope, '__slots__': type_slots}
+    # Else, this class is unslotted.
+
     # Thank you, bizarre 3-parameter variant of the type.__init__() constructor.
     cls = type(type_name, type_bases, type_scope)
 
-    # If this class has a module name...
+    # If this class has a module name, set the module name of this class.
     if type_module_name is not None:
-        # If this module name is *NOT* a valid Python identifier, raise an
-        # exception.
-        if not is_identifier(type_module_name):
-            raise exception_cls(
-                f'Class module name {repr(type_module_name)} invalid.')
-        # Else, this module name is a valid Python identifier.
-
-        # Set the module name of this class.
         cls.__module__ = type_module_name
     # Else, this class has *NO* module name.
 
@@ -120,5 +241,82 @@ def make_type(
         cls.__doc__ = type_doc
     # Else, this class is undocumented.
 
+    # If memoizing this class, cache this class under this key.
+    #
+    # Note that concurrent calls to this factory passed the same parameters
+    # could possibly create and return different classes for those parameters.
+    # Since each such class is equally valid and the last such class is the
+    # only such class cached, this race is both rare and harmless.
+    if is_type_cached:
+        _MAKE_TYPE_CACHE[type_key] = cls
+    # Else, this class is *NOT* memoized.
+
     # Return this class.
     return cls
+
+# ....................{ PRIVATE ~ cachers                  }....................
+def _cache_identifier_valid(
+    identifiers_valid: Set[str], identifier: str) -> None:
+    '''
+    Record the passed identifier as valid by adding this identifier to the
+    passed set of all previously validated identifiers.
+
+    If this set already contains the maximum number of identifiers, this set is
+    first emptied. While crude, this policy bounds the space consumed by this
+    set *without* incurring the space and time costs of a Least Recently Used
+    (LRU) cache. Since validating an identifier *not* in this set is trivial,
+    prematurely discarding previously validated identifiers is harmless.
+
+    Parameters
+    ----------
+    identifiers_valid : Set[str]
+        Set of all previously validated identifiers.
+    identifier : str
+        Identifier to be recorded as valid.
+    '''
+
+    # If this set is full, empty this set.
+    if len(identifiers_valid) >= _IDENTIFIERS_VALID_LEN_MAX:
+        identifiers_valid.clear()
+    # Else, this set is *NOT* full.
+
+    # Record this identifier as valid.
+    identifiers_valid.add(identifier)
+
+# ....................{ PRIVATE ~ globals                  }....................
+_IDENTIFIERS_VALID_LEN_MAX = 1024
+'''
+Maximum number of identifiers recorded by each set of previously validated
+identifiers defined below, after which that set is emptied.
+'''
+
+
+_TYPE_NAMES_VALID: Set[str] = set()
+'''
+Set of all classnames previously validated as valid unqualified Python
+identifiers by the :func:`.make_type` factory.
+'''
+
+
+_TYPE_MODULE_NAMES_VALID: Set[str] = set()
+'''
+Set of all module names previously validated as valid possibly fully-qualified
+Python identifiers by the :func:`.make_type` factory.
+'''
+
+
+_MAKE_TYPE_CACHE: 'WeakValueDictionary[Hashable, type]' = (
+    WeakValueDictionary())
+'''
+**Class cache** (i.e., dictionary mapping from hashable keys uniquely
+identifying the parameters passed to prior calls to the :func:`.make_type`
+factory enabling the ``is_type_cached`` parameter to the classes created and
+returned by those calls).
+
+This cache weakly refers to these classes, bounding the space consumed by this
+cache to the set of classes still referenced elsewhere. When *no* callers
+refer to a cached class, that class is garbage-collected and silently removed
+from this cache. Since that class is unreachable by all callers, recreating
+that class on a subsequent call is indistinguishable from retrieving that class
+from this cache.
+'''
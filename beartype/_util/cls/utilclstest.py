@@ -23,6 +23,7 @@ from beartype._data.hint.datahinttyping import (
     TypeOrTupleTypes,
 )
 from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_10
 
 # ....................{ VALIDATORS                         }....................
 def die_unless_type(
@@ -262,6 +263,57 @@ def is_type_builtin_or_fake(cls: type) -> bool:
     # declaring all builtin types.
     return cls_module_name == BUILTINS_MODULE_NAME
 
+# ....................{ TESTERS ~ immutable                }....................
+def is_type_immutable(cls: type) -> bool:
+    '''
+    :data:`True` only if the passed class is **immutable** (i.e., prohibits
+    attributes from being set on that class, such that the :func:`setattr`
+    builtin unconditionally raises a :exc:`TypeError` when passed that class).
+
+    This tester returns :data:`True` for both:
+
+    * **Static types** (i.e., C-based types statically allocated by CPython and
+      C extensions rather than dynamically allocated on the heap), which
+      includes *all* builtin types (e.g., :class:`str`).
+    * Under Python >= 3.10, **immutable heap types** (i.e., C-based types
+      dynamically allocated on the heap but explicitly flagged as immutable),
+      which includes most types declared by C extensions in the standard
+      library (e.g., :class:`re.Pattern`).
+
+    Note that user-defined subclasses of builtin types are dynamically allocated
+    on the heap *without* being flagged as immutable and are thus mutable.
+
+    This tester is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    cls : type
+        Class to be inspected.
+
+    Returns
+    ----------
+    bool
+        :data:`True` only if this class is immutable.
+    '''
+
+    # Bit field of all flags describing this class.
+    #
+    # Note that Python interpreters failing to define the "__flags__" dunder
+    # attribute on types are conservatively assumed to only define mutable heap
+    # types.
+    cls_flags = getattr(cls, '__flags__', _TPFLAGS_HEAPTYPE)
+
+    # Return true only if this class is either...
+    return (
+        # *NOT* a heap type and thus static *OR*...
+        not cls_flags & _TPFLAGS_HEAPTYPE or
+        # A heap type explicitly flagged as immutable. Note that this flag is
+        # only defined under Python >= 3.10, where this global is non-zero.
+        bool(cls_flags & _TPFLAGS_IMMUTABLETYPE)
+    )
+
 # ....................{ TESTERS ~ subclass                 }....................
 def is_type_subclass(
     cls: object, base_classes: TypeOrTupleTypes) -> bool:
@@ -379,3 +431,20 @@ def is_type_subclass_proper(
             cls is base_classes
         )
     )
+
+# ....................{ PRIVATE ~ constants                }....................
+_TPFLAGS_HEAPTYPE = 1 << 9
+'''
+Bit flag set in the ``__flags__`` dunder attribute of each **heap type** (i.e.,
+type dynamically allocated on the heap, including *all* pure-Python classes),
+mirroring the ``Py_TPFLAGS_HEAPTYPE`` constant defined by the CPython C API.
+'''
+
+
+_TPFLAGS_IMMUTABLETYPE = (1 << 8) if IS_PYTHON_AT_LEAST_3_10 else 0
+'''
+Bit flag set in the ``__flags__`` dunder attribute of each **immutable type**
+(i.e., type prohibiting attributes from being set on that type) under Python
+>= 3.10, mirroring the ``Py_TPFLAGS_IMMUTABLETYPE`` constant defined by the
+CPython C API *or* ``0`` under Python <= 3.9, which fails to define that flag.
+'''
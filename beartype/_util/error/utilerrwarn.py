@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype warning utilities** (i.e., low-level callables introspecting the
+standard :mod:`warnings` module).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.hint.datahinttyping import TypeWarning
+
+# Note that this module is intentionally imported as is rather than importing
+# attributes from this module. Why? Because the standard
+# "warnings.catch_warnings" context manager temporarily *REPLACES* (rather than
+# modifies) the "warnings.filters" global list. Importing that list directly
+# would erroneously preserve a reference to the original list.
+import warnings
+
+# ....................{ TESTERS                            }....................
+def is_warning_ignored(warning_cls: TypeWarning) -> bool:
+    '''
+    :data:`True` only if warnings of the passed category are **unconditionally
+    ignored** (i.e., if the first warning filter matching this category
+    ignores *all* warnings of this category regardless of the messages,
+    modules, and line numbers of those warnings).
+
+    This tester enables callers to avoid the possibly non-trivial cost of
+    constructing the messages of warnings that would simply be ignored.
+
+    Caveats
+    ----------
+    **This tester is conservative.** If the first warning filter matching this
+    category only conditionally applies to some messages, modules, or line
+    numbers, this tester returns :data:`False` *without* attempting to decide
+    whether that filter applies. Callers should then emit their warnings as
+    usual, deferring that decision to the :func:`warnings.warn` function.
+
+    Parameters
+    ----------
+    warning_cls : TypeWarning
+        Warning category to be inspected.
+
+    Returns
+    ----------
+    bool
+        :data:`True` only if warnings of this category are unconditionally
+        ignored.
+    '''
+    assert isinstance(warning_cls, type), f'{repr(warning_cls)} not type.'
+
+    # For the action, message pattern, category, module pattern, and line
+    # number of each warning filter in descending order of precedence...
+    for (
+        filter_action,
+        filter_message,
+        filter_category,
+        filter_module,
+        filter_lineno,
+    ) in warnings.filters:
+        # If this filter applies to this category...
+        if issubclass(warning_cls, filter_category):
+            # Return true only if this filter unconditionally ignores *ALL*
+            # warnings of this category. If this filter only conditionally
+            # applies to warnings of this category, conservatively return false.
+            return (
+                filter_action == 'ignore' and
+                filter_message is None and
+                filter_module is None and
+                not filter_lineno
+            )
+        # Else, this filter does *NOT* apply to this category. In this case,
+        # continue to the next filter.
+
+    # Return true only if the default action applied to warnings matching *NO*
+    # filters ignores those warnings.
+    #
+    # Note that this action is intentionally accessed dynamically. Although
+    # CPython unconditionally defines this undocumented global, typeshed
+    # declares *NO* such global. Directly accessing this global would thus
+    # induce static type-checkers to emit false positives.
+    return getattr(warnings, 'defaultaction', 'default') == 'ignore'
@@ -68,6 +68,17 @@ def is_func_contextlib_contextmanager(func: Any) -> TypeGuard[Callable]:
         # define the "co_qualname" attribute on code objects required to
         # robustly implement this test *OR*...
         IS_PYTHON_AT_MOST_3_10 or
+        # The passed callable is *NOT* a wrapper created by the standard
+        # @functools.wraps decorator *OR*...
+        #
+        # Note that the @contextlib.contextmanager decorator unconditionally
+        # wraps the closure it returns with @functools.wraps and thus sets this
+        # dunder attribute on that closure. Since this tester is called on
+        # *EVERY* pure-Python function decorated by @beartype and since the
+        # overwhelming majority of those functions are *NOT* wrappers, this
+        # trivial attribute test is intentionally performed first as an
+        # efficient short-circuit avoiding the more expensive tests below.
+        not hasattr(func, '__wrapped__') or
         # The passed callable is *NOT* a closure...
         not is_func_closure(func)
     ):
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **Numba** utilities (i.e., callables handling the third-party
+:mod:`numba` package as an optional runtime dependency of this project).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To prevent this project from accidentally requiring third-party
+# packages as mandatory runtime dependencies, avoid importing from *ANY* such
+# package via a module-scoped import. These imports should be isolated to the
+# bodies of callables declared below.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTERS                            }....................
+def is_func_numba_dispatcher(func: object) -> bool:
+    '''
+    :data:`True` only if the passed object is a **Numba dispatcher** (i.e.,
+    pseudo-callable object both created and returned by a just-in-time (JIT)
+    compilation decorator published by the optional third-party :mod:`numba`
+    package, including the :func:`numba.njit`, :func:`numba.jit`,
+    :func:`numba.vectorize`, and :func:`numba.guvectorize` decorators).
+
+    Numba dispatchers define non-standard ``__call__()`` dunder methods
+    dispatching calls to machine code compiled from the pure-Python functions
+    wrapped by those dispatchers. Since those dispatchers are *not* safely
+    monkey-patchable with type-checking, callers should preserve those
+    dispatchers as is.
+
+    This tester intentionally avoids importing from the :mod:`numba` package,
+    instead inspecting the name of the type of this object and the name of the
+    module declaring that type.
+
+    Parameters
+    ----------
+    func : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    bool
+        :data:`True` only if this object is a Numba dispatcher.
+    '''
+
+    # Type of this object.
+    func_type = type(func)
+
+    # Return true only if...
+    return (
+        # The unqualified name of this type is that of a Numba dispatcher type
+        # *AND*...
+        #
+        # Note that this test is intentionally performed first, as the
+        # overwhelming majority of objects are *NOT* Numba dispatchers.
+        func_type.__name__ in _NUMBA_DISPATCHER_TYPE_NAMES and
+        # This type is declared by a Numba submodule.
+        str(getattr(func_type, '__module__', '')).startswith(
+            _NUMBA_MODULE_NAME_PREFIX)
+    )
+
+# ....................{ PRIVATE ~ constants                }....................
+_NUMBA_DISPATCHER_TYPE_NAMES = frozenset((
+    # Type of objects created by the @numba.jit and @numba.njit decorators.
+    'CPUDispatcher',
+    # Type of objects created by the @numba.cuda.jit decorator.
+    'CUDADispatcher',
+    # Type of objects created by the @numba.vectorize decorator when passed
+    # *NO* signatures.
+    'DUFunc',
+    # Type of objects created by the @numba.guvectorize decorator.
+    'GUFunc',
+))
+'''
+Frozen set of the unqualified names of all **Numba dispatcher types** (i.e.,
+types of all pseudo-callable objects created and returned by just-in-time (JIT)
+compilation decorators published by the :mod:`numba` package).
+'''
+
+
+_NUMBA_MODULE_NAME_PREFIX = 'numba.'
+'''
+Substring prefixing the fully-qualified name of each submodule of the
+:mod:`numba` package.
+'''
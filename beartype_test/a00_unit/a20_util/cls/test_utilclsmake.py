@@ -25,6 +25,7 @@ def test_make_type() -> None:
     # ....................{ IMPORTS                        }....................
     # Defer test-specific imports.
     from beartype.roar._roarexc import _BeartypeUtilTypeException
+    from beartype._util.cache.utilcachemeta import BeartypeCachingMeta
     from beartype._util.cls.utilclsmake import make_type
     from beartype._util.cls.utilclstest import is_type_subclass
     from pytest import raises
@@ -35,6 +36,15 @@ def test_make_type() -> None:
         Arbitrary base class from which to subclass classes defined below.
         '''
 
+    class EveryShapeAndSound(object, metaclass=BeartypeCachingMeta):
+        '''
+        Arbitrary base class whose metaclass is a caching metaclass, from which
+        to subclass classes defined below.
+        '''
+
+        def __init__(self, sight: str) -> None:
+            self.sight = sight
+
     # ....................{ PASS                           }....................
     # Assert this factory creates and returns the expected class when the passed
     # name is a valid unqualified Python identifier.
@@ -48,6 +58,21 @@ def test_make_type() -> None:
         type_name='BySolemnVision', type_bases=(TooEnamouredOfThatVoice,))
     assert is_type_subclass(BySolemnVision, TooEnamouredOfThatVoice)
 
+    # Assert this factory creates and returns the expected class when passed a
+    # tuple of one or more base classes whose metaclass is a caching metaclass
+    # memoizing instances of this class.
+    HisInfancyWasNurtured = make_type(
+        type_name='HisInfancyWasNurtured',
+        type_bases=(EveryShapeAndSound,),
+    )
+    assert isinstance(HisInfancyWasNurtured, BeartypeCachingMeta)
+    assert HisInfancyWasNurtured('By solemn vision') is (
+        HisInfancyWasNurtured('By solemn vision'))
+    assert HisInfancyWasNurtured('By solemn vision') is not (
+        HisInfancyWasNurtured('and bright silver dream'))
+    assert isinstance(
+        HisInfancyWasNurtured('By solemn vision'), EveryShapeAndSound)
+
     # Assert this factory creates and returns the expected class when passed a
     # dictionary of one or more class attributes.
     BrightSilverDream = make_type(type_name='BrightSilverDream', type_scope={
@@ -71,6 +96,17 @@ def test_make_type() -> None:
         type_name='TheFountains', type_doc='of divine philosophy')
     assert TheFountains.__doc__ == 'of divine philosophy'
 
+    # Assert this factory creates and returns the expected class when passed a
+    # tuple of slotted instance variable names.
+    HisWanderings = make_type(
+        type_name='HisWanderings', type_slots=('and_the_seeds',))
+    his_wanderings = HisWanderings()
+    his_wanderings.and_the_seeds = 'Like flocks to feed in air'
+    assert HisWanderings.__slots__ == ('and_the_seeds',)
+    assert not hasattr(his_wanderings, '__dict__')
+    with raises(AttributeError):
+        his_wanderings.of_divine_philosophy = 'Left no strange truth untaught'
+
     # ....................{ FAIL                           }....................
     # Assert this factory raises the expected exception when the passed name is
     # the empty string.
@@ -100,3 +136,136 @@ def test_make_type() -> None:
             type_name='And_Silence',
             type_module_name='Locks its mute music in her rugged cell.',
         )
+
+
+def test_make_type_cached() -> None:
+    '''
+    Test the :func:`beartype._util.cls.utilclsmake.make_type` factory when
+    passed the ``is_type_cached`` parameter.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype._util.cls.utilclsmake import make_type
+    from gc import collect
+    from weakref import ref
+
+    # ....................{ LOCALS                         }....................
+    class TheDisappointments(object):
+        '''
+        Arbitrary base class from which to subclass classes defined below.
+        '''
+
+    # ....................{ PASS ~ scope : empty           }....................
+    # Arbitrary memoized class with an empty scope.
+    TheSpiritOfSweetHuman = make_type(
+        type_name='TheSpiritOfSweetHuman',
+        type_module_name='the_disappointments',
+        type_bases=(TheDisappointments,),
+        type_doc='who spurned her choicest gifts.',
+        is_type_cached=True,
+    )
+
+    # Assert that memoizing this class when passed the same parameters returns
+    # the same class.
+    assert make_type(
+        type_name='TheSpiritOfSweetHuman',
+        type_module_name='the_disappointments',
+        type_bases=(TheDisappointments,),
+        type_doc='who spurned her choicest gifts.',
+        is_type_cached=True,
+    ) is TheSpiritOfSweetHuman
+
+    # Assert that memoizing this class when passed different parameters returns
+    # a different class.
+    assert make_type(
+        type_name='TheSpiritOfSweetHuman',
+        type_module_name='the_disappointments',
+        type_bases=(TheDisappointments,),
+        type_doc='who spurned her choicest ghosts.',
+        is_type_cached=True,
+    ) is not TheSpiritOfSweetHuman
+
+    # Assert that *NOT* memoizing this class returns a different class.
+    assert make_type(
+        type_name='TheSpiritOfSweetHuman',
+        type_module_name='the_disappointments',
+        type_bases=(TheDisappointments,),
+        type_doc='who spurned her choicest gifts.',
+    ) is not TheSpiritOfSweetHuman
+
+    # Assert that memoized classes no longer referenced elsewhere are
+    # garbage-collected and thus silently removed from the class cache.
+    WithMightyProvidence = make_type(
+        type_name='WithMightyProvidence', is_type_cached=True)
+    with_mighty_providence_ref = ref(WithMightyProvidence)
+    del WithMightyProvidence
+    collect()
+    assert with_mighty_providence_ref() is None
+
+    # ....................{ PASS ~ scope : non-empty       }....................
+    # Assert that memoizing a class with a non-empty scope *WITHOUT* a key
+    # identifying that scope silently returns a new class.
+    assert make_type(
+        type_name='HeDreamed',
+        type_scope={'a_veiled_maid': 'Sate near him'},
+        is_type_cached=True,
+    ) is not make_type(
+        type_name='HeDreamed',
+        type_scope={'a_veiled_maid': 'Sate near him'},
+        is_type_cached=True,
+    )
+
+    # Assert that memoizing classes whose scopes contain distinct values
+    # comparing equal *WITHOUT* keys identifying those scopes returns distinct
+    # classes defining those values. Since "1 == 1.0 == True", keys derived
+    # from these values would erroneously collide.
+    TalkingInLow = make_type(
+        type_name='TalkingInLow',
+        type_scope={'solemn_tones': 1},
+        is_type_cached=True,
+    )
+    TalkingInLowTrue = make_type(
+        type_name='TalkingInLow',
+        type_scope={'solemn_tones': True},
+        is_type_cached=True,
+    )
+    TalkingInLowFloat = make_type(
+        type_name='TalkingInLow',
+        type_scope={'solemn_tones': 1.0},
+        is_type_cached=True,
+    )
+    assert TalkingInLowTrue is not TalkingInLow
+    assert TalkingInLowFloat is not TalkingInLow
+    assert type(TalkingInLow.solemn_tones) is int
+    assert type(TalkingInLowTrue.solemn_tones) is bool
+    assert type(TalkingInLowFloat.solemn_tones) is float
+
+    # Assert that memoizing a class whose scope contains unhashable values
+    # identified by a caller-defined hashable key returns the same class.
+    type_scope_unhashable = {'her_voice': ['was like the voice of his soul']}
+    assert make_type(
+        type_name='HeDreamed',
+        type_scope=type_scope_unhashable,
+        is_type_cached=True,
+        type_scope_key='a veiled maid',
+    ) is make_type(
+        type_name='HeDreamed',
+        type_scope=type_scope_unhashable,
+        is_type_cached=True,
+        type_scope_key='a veiled maid',
+    )
+
+    # Assert that memoizing a class whose scope is identified by an unhashable
+    # key silently returns a new class.
+    assert make_type(
+        type_name='HeDreamed',
+        type_scope=type_scope_unhashable,
+        is_type_cached=True,
+        type_scope_key=['a veiled maid'],
+    ) is not make_type(
+        type_name='HeDreamed',
+        type_scope=type_scope_unhashable,
+        is_type_cached=True,
+        type_scope_key=['a veiled maid'],
+    )
@@ -118,3 +118,36 @@ def test_is_type_builtin_or_fake() -> None:
 
     # Assert this tester rejects an arbitrary non-builtin type.
     assert is_type_builtin_or_fake(Class) is False
+
+
+def test_is_type_immutable() -> None:
+    '''
+    Test the :func:`beartype._util.cls.utilclstest.is_type_immutable` tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cls.utilclstest import is_type_immutable
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_10
+    from beartype_test.a00_unit.data.data_type import Class
+
+    class ThePathOfThyDeparture(str):
+        '''
+        Arbitrary subclass of an immutable builtin type.
+        '''
+
+        pass
+
+    # Assert this tester accepts immutable builtin types.
+    assert is_type_immutable(str) is True
+    assert is_type_immutable(object) is True
+
+    # If the active Python interpreter targets Python >= 3.10, assert this
+    # tester accepts immutable heap types declared by C extensions.
+    if IS_PYTHON_AT_LEAST_3_10:
+        from re import Pattern
+        assert is_type_immutable(Pattern) is True
+
+    # Assert this tester rejects mutable user-defined types, including
+    # subclasses of immutable builtin types.
+    assert is_type_immutable(Class) is False
+    assert is_type_immutable(ThePathOfThyDeparture) is False
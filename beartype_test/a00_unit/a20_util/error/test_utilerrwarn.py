@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype warning utility unit tests.**
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.error.utilerrwarn` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from pytest import MonkeyPatch
+
+# ....................{ TESTS ~ tester                     }....................
+def test_is_warning_ignored(monkeypatch: MonkeyPatch) -> None:
+    '''
+    Test the :func:`beartype._util.error.utilerrwarn.is_warning_ignored`
+    tester.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        :mod:`pytest` fixture allowing various state associated with the active
+        Python process to be temporarily changed for the duration of this test.
+    '''
+
+    # Defer test-specific imports.
+    import warnings
+    from beartype._util.error.utilerrwarn import is_warning_ignored
+    from warnings import (
+        catch_warnings,
+        filterwarnings,
+        simplefilter,
+    )
+
+    class UponTheMountainTop(UserWarning):
+        '''
+        Arbitrary warning category.
+        '''
+
+        pass
+
+    # Isolate all warning filters added below to this context.
+    with catch_warnings():
+        # Assert this tester returns false for a warning category whose first
+        # matching filter is *NOT* an "ignore" filter.
+        simplefilter('error')
+        assert is_warning_ignored(UponTheMountainTop) is False
+
+        # Assert this tester returns true for a warning category whose first
+        # matching filter unconditionally ignores that category.
+        simplefilter('ignore', UponTheMountainTop)
+        assert is_warning_ignored(UponTheMountainTop) is True
+
+        # Assert this tester returns false for a parent warning category *NOT*
+        # ignored by that filter.
+        assert is_warning_ignored(UserWarning) is False
+
+        # Assert this tester conservatively returns false for a warning
+        # category whose first matching filter only conditionally ignores
+        # warnings with matching messages.
+        filterwarnings(
+            'ignore', message='^Mont Blanc', category=UponTheMountainTop)
+        assert is_warning_ignored(UponTheMountainTop) is False
+
+        # Assert this tester conservatively returns false for a warning
+        # category whose first matching filter only conditionally ignores
+        # warnings emitted by matching modules.
+        filterwarnings(
+            'ignore', category=UponTheMountainTop, module='^mont_blanc')
+        assert is_warning_ignored(UponTheMountainTop) is False
+
+        # Assert this tester conservatively returns false for a warning
+        # category whose first matching filter only conditionally ignores
+        # warnings emitted at a matching line number.
+        filterwarnings('ignore', category=UponTheMountainTop, lineno=42)
+        assert is_warning_ignored(UponTheMountainTop) is False
+
+    # Assert this tester falls back to the default action when *NO* filter
+    # matches a warning category. Note that the "catch_warnings" context
+    # manager does *NOT* preserve the default action, which is thus
+    # monkey-patched instead.
+    monkeypatch.setattr(warnings, 'filters', [])
+    monkeypatch.setattr(warnings, 'defaultaction', 'ignore')
+    assert is_warning_ignored(UponTheMountainTop) is True
+    monkeypatch.setattr(warnings, 'defaultaction', 'default')
+    assert is_warning_ignored(UponTheMountainTop) is False
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2023 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **Numba** unit tests.
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.module.lib.utilnumba` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS ~ tester                     }....................
+def test_is_func_numba_dispatcher() -> None:
+    '''
+    Test the
+    :func:`beartype._util.module.lib.utilnumba.is_func_numba_dispatcher`
+    tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.module.lib.utilnumba import is_func_numba_dispatcher
+
+    class CPUDispatcher(object):
+        '''
+        Arbitrary pseudo-callable type masquerading as the Numba dispatcher
+        type of the same name, avoiding a test-time dependency on Numba.
+        '''
+
+        def __call__(self, *args, **kwargs) -> None:
+            pass
+
+    # Masquerade this type as being declared by a Numba submodule.
+    CPUDispatcher.__module__ = 'numba.core.registry'
+
+    class OtherDispatcher(CPUDispatcher):
+        '''
+        Arbitrary pseudo-callable type *not* masquerading as a Numba
+        dispatcher type.
+        '''
+
+        pass
+
+    # Arbitrary instance of this fake Numba dispatcher type.
+    that_cavern_dew = CPUDispatcher()
+
+    # Assert this tester accepts this fake Numba dispatcher.
+    assert is_func_numba_dispatcher(that_cavern_dew) is True
+
+    # Assert this tester rejects objects that are *NOT* Numba dispatchers.
+    assert is_func_numba_dispatcher(OtherDispatcher()) is False
+    assert is_func_numba_dispatcher(len) is False
+    assert is_func_numba_dispatcher(is_func_numba_dispatcher) is False
@@ -97,6 +97,12 @@ def test_api_conf_dataclass() -> None:
     assert BEAR_CONF_NONDEFAULT._is_warning_cls_on_decorator_exception_set is (
         True)
 
+    # Assert that configurations are slotted and thus define *NO* instance
+    # dictionaries. Since beartype_object() accesses configuration fields on
+    # every decoration, these fields are intentionally stored in slots.
+    assert not hasattr(BEAR_CONF_DEFAULT, '__dict__')
+    assert not hasattr(BEAR_CONF_NONDEFAULT, '__dict__')
+
     # Assert that two differing configurations compare unequal.
     assert BEAR_CONF_DEFAULT != BEAR_CONF_NONDEFAULT
 
@@ -152,6 +152,102 @@ def test_decor_conf_is_debug(capsys) -> None:
         # * Suffixing substrings (e.g., diagnostic comments).
         assert code_line in stdout_line
 
+
+def test_decor_conf_warning_cls_on_decorator_exception() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``warning_cls_on_decorator_exception``
+    parameter.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from warnings import (
+        catch_warnings,
+        simplefilter,
+    )
+
+    # ....................{ CLASSES                        }....................
+    class TheSecretStrength(object):
+        '''
+        Arbitrary class whose instances are unhashable by raising a
+        non-beartype-specific exception, inducing the :func:`beartype.beartype`
+        decorator to raise that exception when decorating callables annotated
+        by these instances.
+        '''
+
+        def __hash__(self) -> int:
+            raise ValueError('The secret strength of things\nWhich governs.')
+
+    # ....................{ LOCALS                         }....................
+    # Decorator coercing fatal exceptions into non-fatal warnings.
+    beartype_nonfatal = beartype(conf=BeartypeConf(
+        warning_cls_on_decorator_exception=UserWarning))
+
+    def all_seems_eternal(now: 42) -> None:
+        '''
+        Arbitrary callable annotated by an unsupported type hint, inducing the
+        :func:`beartype.beartype` decorator to raise a beartype-specific
+        exception when decorating this callable.
+        '''
+
+        pass
+
+    def of_things_which(governs: TheSecretStrength()) -> None:
+        '''
+        Arbitrary callable annotated by an unhashable type hint, inducing the
+        :func:`beartype.beartype` decorator to raise a non-beartype-specific
+        exception when decorating this callable.
+        '''
+
+        pass
+
+    # ....................{ PASS ~ ignore                  }....................
+    # Assert that decorating this callable when warnings of this category are
+    # ignored returns this callable as is *WITHOUT* emitting a warning.
+    with catch_warnings(record=True) as warnings_emitted:
+        simplefilter('ignore')
+        assert beartype_nonfatal(all_seems_eternal) is all_seems_eternal
+    assert not warnings_emitted
+
+    # ....................{ PASS ~ always                  }....................
+    # Assert that decorating this callable when warnings of this category are
+    # emitted returns this callable as is *AND* emits exactly one warning whose
+    # message is capitalized and single-line.
+    with catch_warnings(record=True) as warnings_emitted:
+        simplefilter('always')
+        assert beartype_nonfatal(all_seems_eternal) is all_seems_eternal
+    assert len(warnings_emitted) == 1
+    assert warnings_emitted[0].category is UserWarning
+    warning_message = str(warnings_emitted[0].message)
+    assert warning_message[0].isupper()
+    assert warning_message.startswith('Function ')
+    assert 'all_seems_eternal' in warning_message
+
+    # Assert that decorating this callable raising a non-beartype-specific
+    # exception emits exactly one warning whose message embeds the traceback of
+    # that exception indented by four spaces.
+    with catch_warnings(record=True) as warnings_emitted:
+        simplefilter('always')
+        assert beartype_nonfatal(of_things_which) is of_things_which
+    assert len(warnings_emitted) == 1
+    warning_message = str(warnings_emitted[0].message)
+    assert warning_message.startswith('Function ')
+
+    # List of all lines of this message, excluding the first line describing
+    # this callable and the second line introducing that traceback.
+    warning_message_lines = warning_message.split('\n')[2:]
+    assert warning_message_lines
+    assert all(
+        warning_message_line.startswith('    ')
+        for warning_message_line in warning_message_lines
+    )
+    assert '    Which governs.' in warning_message_lines
+
 # ....................{ TESTS ~ strategy                   }....................
 def test_decor_conf_strategy_O0() -> None:
     '''
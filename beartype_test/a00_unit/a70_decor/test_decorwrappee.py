@@ -16,6 +16,7 @@ concerns (e.g., PEP-compliance, PEP-noncompliance).
 # WARNING: To raise human-readable test errors, avoid importing from
 # package-specific submodules at module scope.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from pytest import MonkeyPatch
 
 # ....................{ TESTS ~ wrappee                    }....................
 def test_decor_wrappee_decorator_builtin() -> None:
@@ -291,6 +292,260 @@ def test_decor_wrappee_callable_pseudo() -> None:
         unseen_presence(
             b'Who chariotest to their dark wintry bed')
 
+
+def test_decor_wrappee_callable_pseudo_numba() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on **Numba dispatchers**
+    (i.e., pseudo-callables created by the just-in-time (JIT) compilation
+    decorators of the third-party :mod:`numba` package).
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import beartype
+
+    # ....................{ CLASSES                        }....................
+    class CPUDispatcher(object):
+        '''
+        Arbitrary pseudo-callable type masquerading as the Numba dispatcher
+        type of the same name, avoiding a test-time dependency on Numba.
+        '''
+
+        def __call__(self, the_winged_seeds: str) -> str:
+            '''Arbitrary docstring.'''
+
+            return the_winged_seeds
+
+    # Masquerade this type as being declared by a Numba submodule.
+    CPUDispatcher.__module__ = 'numba.core.registry'
+
+    # ....................{ LOCALS                         }....................
+    # Undecorated __call__() dunder method defined by this type.
+    the_winged_seeds_call = CPUDispatcher.__dict__['__call__']
+
+    # Arbitrary instance of this fake Numba dispatcher type.
+    that_cavern_dew = CPUDispatcher()
+
+    # ....................{ PASS                           }....................
+    # Assert that @beartype preserves this Numba dispatcher as is *WITHOUT*
+    # monkey-patching the type of this dispatcher with type-checking.
+    assert beartype(that_cavern_dew) is that_cavern_dew
+    assert CPUDispatcher.__dict__['__call__'] is the_winged_seeds_call
+    assert that_cavern_dew(b'Where they lie cold and low') == (
+        b'Where they lie cold and low')
+
+
+def test_decor_wrappee_type_redecorated(monkeypatch: MonkeyPatch) -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on **redecorated classes**
+    (i.e., classes previously decorated by this decorator).
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        :mod:`pytest` fixture allowing various state associated with the active
+        Python process to be temporarily changed for the duration of this test.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype._decor import decorcore
+    from pytest import raises
+
+    # ....................{ CLASSES                        }....................
+    @beartype
+    class TheLocustsThinAndDry(object):
+        '''
+        Arbitrary class directly defining an annotated ``__init__`` method.
+        '''
+
+        def __init__(self, the_winged_seeds: str) -> None:
+            '''Arbitrary docstring.'''
+
+            self.the_winged_seeds = the_winged_seeds
+
+    class WhereTheyLieColdAndLow(TheLocustsThinAndDry):
+        '''
+        Arbitrary subclass inheriting that ``__init__`` method and directly
+        defining an annotated method.
+        '''
+
+        def each_like_a_corpse(self, within_its_grave: str) -> str:
+            '''Arbitrary docstring.'''
+
+            return f'{self.the_winged_seeds}{within_its_grave}'
+
+    # ....................{ LOCALS                         }....................
+    # "__init__" method wrapped with runtime type-checking by the decoration
+    # above.
+    the_winged_seeds_init = TheLocustsThinAndDry.__dict__['__init__']
+
+    # Original function decorating each beartypeable attribute of each
+    # decorated class.
+    beartype_object_old = decorcore.beartype_object
+
+    # List of all beartypeable attributes decorated by that function.
+    attrs_decorated = []
+
+    def beartype_object_counted(obj, *args, **kwargs):
+        '''
+        Wrapper recording each beartypeable attribute decorated by the original
+        :func:`beartype._decor.decorcore.beartype_object` function.
+        '''
+
+        attrs_decorated.append(obj)
+        return beartype_object_old(obj, *args, **kwargs)
+
+    # Record each beartypeable attribute decorated by that function.
+    monkeypatch.setattr(decorcore, 'beartype_object', beartype_object_counted)
+
+    # ....................{ PASS                           }....................
+    # Assert that decorating this class recorded this class as decorated on the
+    # "__init__" method directly defined by this class.
+    assert the_winged_seeds_init.__beartyped_cls is TheLocustsThinAndDry
+
+    # Assert that this subclass inheriting that method is *NOT* recorded as
+    # decorated, despite that method being accessible on this subclass.
+    assert WhereTheyLieColdAndLow.__init__.__beartyped_cls is not (
+        WhereTheyLieColdAndLow)
+
+    # Assert that redecorating this class reduces to a noop returning this
+    # class with the same type-checking "__init__" method as is *WITHOUT*
+    # decorating any attributes of this class.
+    assert beartype(TheLocustsThinAndDry) is TheLocustsThinAndDry
+    assert TheLocustsThinAndDry.__dict__['__init__'] is the_winged_seeds_init
+    assert attrs_decorated == []
+
+    # Assert that decorating this subclass inheriting that method still
+    # decorates the methods directly defined by this subclass.
+    assert beartype(WhereTheyLieColdAndLow) is WhereTheyLieColdAndLow
+    assert attrs_decorated == [
+        WhereTheyLieColdAndLow.__dict__['each_like_a_corpse'].__wrapped__]
+    their_azure_sister = WhereTheyLieColdAndLow('Thine azure sister')
+
+    # ....................{ FAIL                           }....................
+    # Assert that both this class and subclass raise the expected exception
+    # when passed invalid parameters.
+    with raises(BeartypeCallHintParamViolation):
+        TheLocustsThinAndDry(b'Driving sweet buds like flocks to feed in air')
+    with raises(BeartypeCallHintParamViolation):
+        their_azure_sister.each_like_a_corpse(
+            b'With living hues and odours plain and hill')
+
+
+def test_decor_wrappee_type_nested_foreign() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on classes aliasing **foreign
+    classes** (i.e., classes declared by a different module than that of the
+    decorated class) as class attributes.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from pytest import raises
+
+    # ....................{ CLASSES                        }....................
+    class DrivingSweetBuds(object):
+        '''
+        Arbitrary class masquerading as a foreign class declared by a different
+        module than that of the decorated class below.
+        '''
+
+        def like_flocks_to_feed(self, in_air: str) -> str:
+            '''Arbitrary docstring.'''
+
+            return in_air
+
+    # Masquerade this class as being declared by a third-party package.
+    DrivingSweetBuds.__module__ = 'wild_spirit.which_art_moving'
+
+    # Undecorated method directly defined by this foreign class.
+    like_flocks_to_feed = DrivingSweetBuds.__dict__['like_flocks_to_feed']
+
+    @beartype
+    class WithLivingHues(object):
+        '''
+        Arbitrary class aliasing that foreign class while lexically nesting a
+        class declared by the same module.
+        '''
+
+        # Foreign class aliased as a class attribute.
+        and_odours = DrivingSweetBuds
+
+        class PlainAndHill(object):
+            '''
+            Arbitrary class lexically nested in this class.
+            '''
+
+            def destroyer_and(self, preserver: str) -> str:
+                '''Arbitrary docstring.'''
+
+                return preserver
+
+    # ....................{ PASS                           }....................
+    # Assert that decorating this class preserved the method directly defined
+    # by that foreign class as is.
+    assert DrivingSweetBuds.__dict__['like_flocks_to_feed'] is (
+        like_flocks_to_feed)
+
+    # ....................{ FAIL                           }....................
+    # Assert that decorating this class decorated the method directly defined
+    # by this lexically nested class.
+    with raises(BeartypeCallHintParamViolation):
+        WithLivingHues.PlainAndHill().destroyer_and(b'Hear, oh hear!')
+
+
+def test_decor_wrappee_type_nested_module_overridden() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on classes lexically nested in
+    decorated classes whose ``__module__`` dunder attributes are overridden
+    (e.g., to publish those classes from public modules).
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from pytest import raises
+
+    # ....................{ CLASSES                        }....................
+    @beartype
+    class ThouForWhose(object):
+        '''
+        Arbitrary class overriding the name of the module declaring this class
+        while lexically nesting a class *not* overriding that name.
+        '''
+
+        # Publish this class from an arbitrary public module.
+        __module__ = 'the_level_powers.of_the_atlantic'
+
+        class PathTheLevelPowers(object):
+            '''
+            Arbitrary class lexically nested in this class.
+            '''
+
+            def cleave_themselves(self, into_chasms: int) -> int:
+                '''Arbitrary docstring.'''
+
+                return into_chasms
+
+    # ....................{ PASS                           }....................
+    # Assert that the method directly defined by this nested class accepts
+    # valid parameters.
+    assert ThouForWhose.PathTheLevelPowers().cleave_themselves(42) == 42
+
+    # ....................{ FAIL                           }....................
+    # Assert that decorating this class decorated the method directly defined
+    # by this lexically nested class, despite these classes residing in
+    # different modules.
+    with raises(BeartypeCallHintParamViolation):
+        ThouForWhose.PathTheLevelPowers().cleave_themselves(
+            'while far below')
+
 # ....................{ TESTS ~ fail : arg                 }....................
 def test_decor_arg_name_fail() -> None:
     '''